@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+from operator import attrgetter
 from typing import Sequence
 
 from homebox_api import HomeboxApiManager
@@ -14,6 +15,17 @@ __all__ = [
 ]
 
 
+def _compile_name_pattern(pattern: str) -> re.Pattern[str]:
+    """Compile the user-supplied name filter regex."""
+
+    try:
+        return re.compile(pattern, re.IGNORECASE)
+    except re.error as exc:
+        raise SystemExit(
+            f"Invalid --name-pattern regex '{pattern}': {exc}"
+        ) from exc
+
+
 def _filter_locations_by_name(
     locations: Sequence[Location],
     pattern: str | None,
@@ -23,14 +35,8 @@ def _filter_locations_by_name(
     if not pattern:
         return list(locations)
 
-    try:
-        name_re = re.compile(pattern, re.IGNORECASE)
-    except re.error as exc:
-        raise SystemExit(
-            f"Invalid --name-pattern regex '{pattern}': {exc}"
-        ) from exc
-
-    return [loc for loc in locations if name_re.search(loc.name or "")]
+    search = _compile_name_pattern(pattern).search
+    return [loc for loc in locations if search(loc.name or "")]
 
 
 def collect_locations(
@@ -41,10 +47,7 @@ def collect_locations(
 
     locations = api_manager.list_locations()
     filtered_locations = _filter_locations_by_name(locations, name_pattern)
-    filtered_locations.sort(
-        key=lambda loc: loc.id,
-        reverse=True,
-    )
+    filtered_locations.sort(key=attrgetter("id"), reverse=True)
 
     return list(filtered_locations)
 
@@ -59,18 +62,9 @@ def collect_assets(
     items = api_manager.list_items(location_id=location_id)
 
     if name_pattern:
-        try:
-            name_re = re.compile(name_pattern, re.IGNORECASE)
-        except re.error as exc:
-            raise SystemExit(
-                f"Invalid --name-pattern regex '{name_pattern}': {exc}"
-            ) from exc
-
-        items = [
-            item for item in items
-            if name_re.search((item.name or "").strip())
-        ]
-
-    items.sort(key=lambda item: (item.id or ""), reverse=True)
+        search = _compile_name_pattern(name_pattern).search
+        items = [item for item in items if search((item.name or "").strip())]
+
+    items.sort(key=attrgetter("id"), reverse=True)
 
     return list(items)
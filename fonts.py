@@ -20,6 +20,10 @@ from reportlab.pdfbase.ttfonts import TTFont as ReportLabTTFont
 
 FONTS_DIR = Path(__file__).resolve().parent / "fonts"
 
+# OpenType layout tables. ReportLab draws unshaped text, so it never reads
+# them, yet instancing them dominates the cost of creating a weight.
+_UNUSED_LAYOUT_TABLES = ("GSUB", "GPOS", "GDEF")
+
 
 @dataclass(frozen=True)
 class LocalVariableFont:
@@ -122,6 +126,9 @@ class VariableFontManager:
 
     def _instantiate(self, weight: float) -> BytesIO:
         font = VariableTTFont(BytesIO(self._font_bytes))
+        for tag in _UNUSED_LAYOUT_TABLES:
+            if tag in font:
+                del font[tag]
         instancer.instantiateVariableFont(font, {"wght": weight}, inplace=True)
         self._ensure_unique_ps_name(font, weight)
         buffer = BytesIO()
@@ -72,14 +72,17 @@ class HomeboxApiManager:
         )
         if not locations_raw:
             return []
-        loc_ids: list[str] = []
-        for loc in locations_raw:
-            loc_id = self._as_str(loc.id)
-            if loc_id:
-                loc_ids.append(loc_id)
+        # Order-preserving dedupe so each location is fetched only once.
+        loc_ids = list(
+            dict.fromkeys(
+                loc_id
+                for loc_id in (self._as_str(loc.id) for loc in locations_raw)
+                if loc_id
+            )
+        )
         detail_map = self.get_location_details(loc_ids)
         tree = self.get_location_tree()
-        path_map = self._build_location_paths(tree)
+        path_map, parent_map = self._build_location_paths(tree)
         labels_map, asset_count_map = self.get_location_item_labels(loc_ids)
 
         domain: list[Location] = []
@@ -95,15 +98,12 @@ class HomeboxApiManager:
 
             title, content = self._split_name_content(self._as_str(loc.name))
 
-            path_list = path_map.get(loc_id, [])
-            parent = path_list[-2] if len(path_list) >= 2 else ""
-
             domain.append(
                 Location(
                     id=loc_id,
                     display_id=title,
                     name=content,
-                    parent=parent,
+                    parent=parent_map.get(loc_id, ""),
                     asset_count=asset_count,
                     labels=label_names,
                     description=description,
@@ -295,24 +295,31 @@ class HomeboxApiManager:
             )
         return AuthenticatedClient(base_url=api_base, token=token, timeout=timeout)
 
-    def _build_location_paths(self, tree: list[RepoTreeItem]) -> dict[str, list[str]]:
+    def _build_location_paths(
+        self,
+        tree: list[RepoTreeItem],
+    ) -> tuple[dict[str, list[str]], dict[str, str]]:
+        """Return (path names, parent name) keyed by location id."""
+
         paths: dict[str, list[str]] = {}
+        parents: dict[str, str] = {}
 
-        def walk(node: RepoTreeItem, ancestors: list[str]) -> None:
+        def walk(node: RepoTreeItem, ancestors: tuple[str, ...]) -> None:
             node_type = self._as_str(node.type_).lower()
             if node_type and node_type != "location":
                 return
             name = self._as_str(node.name).strip() or "Unnamed"
-            current_path = ancestors + [name]
+            current_path = ancestors + (name,)
             loc_id = self._as_str(node.id)
             if loc_id:
-                paths[loc_id] = current_path
+                paths[loc_id] = list(current_path)
+                parents[loc_id] = ancestors[-1] if ancestors else ""
             for child in self._as_list(node.children):
                 walk(child, current_path)
 
         for root in tree or []:
-            walk(root, [])
-        return paths
+            walk(root, ())
+        return paths, parents
 
     def _as_str(self, value: str | Unset | None) -> str:
         if isinstance(value, Unset) or value is None:
@@ -347,12 +354,11 @@ class HomeboxApiManager:
             return "", ""
 
         match = self._location_id_regex.search(text)
-        if match and match.group(1) and match.group(2) is not None:
-            display_id = match.group(1).strip()
-            if not display_id:
-                return "", text
-            cleaned_name = match.group(2).strip()
-            if not cleaned_name:
-                cleaned_name = display_id
-            return display_id, cleaned_name
-        return "", text
+        if match is None:
+            return "", text
+
+        raw_id, raw_name = match.group(1, 2)
+        display_id = raw_id.strip() if raw_id else ""
+        if not display_id or raw_name is None:
+            return "", text
+        return display_id, raw_name.strip() or display_id
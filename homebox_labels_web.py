@@ -8,7 +8,7 @@ from dataclasses import replace
 from pathlib import Path
 from tempfile import NamedTemporaryFile, TemporaryDirectory
 import zipfile
-from typing import Any
+from typing import Any, Iterable, TypeVar
 
 from dotenv import load_dotenv
 from flask import (
@@ -25,6 +25,7 @@ from werkzeug.wrappers import Response
 
 from homebox_api import HomeboxApiManager
 from domain_data import collect_locations, collect_assets
+from domain_types import Asset, Location
 from label_templates.label_data import (
     locations_to_label_contents,
     assets_to_label_contents,
@@ -39,6 +40,8 @@ from label_templates.base import LabelTemplate, TemplateOption
 
 __all__ = ["run_web_app", "create_app", "create_app_from_env"]
 
+_Record = TypeVar("_Record", Location, Asset)
+
 
 def create_app(
     api_manager: HomeboxApiManager,
@@ -135,6 +138,22 @@ def create_app(
             base_ids.append(base_id)
         return base_ids
 
+    def _index_by_id(
+        records: Iterable[_Record],
+        wanted_ids: Iterable[str],
+    ) -> dict[str, _Record]:
+        """Map wanted IDs to their records, stopping once all are found."""
+        wanted = set(wanted_ids)
+        found: dict[str, _Record] = {}
+        if not wanted:
+            return found
+        for record in records:
+            if record.id in wanted:
+                found[record.id] = record
+                if len(found) == len(wanted):
+                    break
+        return found
+
     def _parse_template_options(
         form: ImmutableMultiDict[str, str],
         location_ids: list[str],
@@ -372,7 +391,7 @@ def create_app(
 
         try:
             locs = collect_locations(api_manager, name_pattern=None)
-            loc_by_id = {loc.id: loc for loc in locs}
+            loc_by_id = _index_by_id(locs, base_ids)
             ordered = [loc_by_id[loc_id]
                        for loc_id in base_ids if loc_id in loc_by_id]
             label_contents = locations_to_label_contents(ordered, base_ui)
@@ -429,7 +448,7 @@ def create_app(
 
         try:
             locs = collect_locations(api_manager, name_pattern=None)
-            loc_map = {loc.id: loc for loc in locs}
+            loc_map = _index_by_id(locs, _dedupe_base_ids(selected_ids))
             labels: list[LabelContent] = []
             for loc_id in selected_ids:
                 base_id = loc_id.split("__copy", 1)[0]
@@ -548,8 +567,9 @@ def create_app(
         copies = int(request.form.get("copies", "1") or "1")
 
         try:
+            wanted_ids = set(base_ids)
             assets = collect_assets(api_manager, name_pattern=None)
-            assets = [a for a in assets if a.id in base_ids]
+            assets = [a for a in assets if a.id in wanted_ids]
             label_contents = assets_to_label_contents(assets, base_ui)
         except Exception as exc:  # pragma: no cover
             return _redirect_generation_error("assets_index", exc)
@@ -604,7 +624,7 @@ def create_app(
 
         try:
             assets = collect_assets(api_manager, name_pattern=None)
-            asset_map = {a.id: a for a in assets}
+            asset_map = _index_by_id(assets, _dedupe_base_ids(selected_ids))
             labels: list[LabelContent] = []
             for asset_id in selected_ids:
                 base_id = asset_id.split("__copy", 1)[0]
@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Iterable
 from types import ModuleType
 from importlib import import_module
 
 from .base import LabelTemplate
 
-_TEMPLATE_NAMES = {"avery5163", "ptouch"}
+_TEMPLATE_NAMES = frozenset({"avery5163", "ptouch"})
+_SORTED_TEMPLATE_NAMES = tuple(sorted(_TEMPLATE_NAMES))
 
 
 def _load_template_module(name: str) -> ModuleType:
@@ -17,6 +19,20 @@ def _load_template_module(name: str) -> ModuleType:
     return import_module(f"{__name__}.{key}")
 
 
+@lru_cache(maxsize=None)
+def _resolve_template_cls(key: str) -> type[LabelTemplate]:
+    """Import and validate the ``Template`` class for ``key`` once."""
+
+    module = _load_template_module(key)
+
+    template_cls = getattr(module, "Template", None)
+    if not isinstance(template_cls, type) or not issubclass(template_cls, LabelTemplate):
+        raise SystemExit(
+            f"Template '{key}' does not export a valid Template class"
+        )
+    return template_cls
+
+
 def get_template(
     name: str,
 ) -> LabelTemplate:
@@ -24,24 +40,15 @@ def get_template(
 
     key = name.lower()
     if key not in _TEMPLATE_NAMES:
-        available = ", ".join(sorted(_TEMPLATE_NAMES))
+        available = ", ".join(_SORTED_TEMPLATE_NAMES)
         raise SystemExit(
             f"Unknown template '{name}'. Available templates: {available}"
         )
 
-    module = _load_template_module(key)
-
-    template_cls = getattr(module, "Template", None)
-    if not isinstance(template_cls, type) or not issubclass(template_cls, LabelTemplate):
-        raise SystemExit(
-            f"Template '{name}' does not export a valid Template class"
-        )
-
-    template = template_cls()
-    return template
+    return _resolve_template_cls(key)()
 
 
 def list_templates() -> Iterable[str]:
     """Return the template identifiers."""
 
-    return sorted(_TEMPLATE_NAMES)
+    return _SORTED_TEMPLATE_NAMES
@@ -3,6 +3,10 @@
 from __future__ import annotations
 
 from enum import StrEnum
+from io import BytesIO
+from typing import TYPE_CHECKING, Callable, Iterator, Sequence
+
+from reportlab.pdfgen import canvas
 
 from label_templates.label_types import LabelContent, LabelGeometry
 from ..base import LabelTemplate, TemplateOption
@@ -19,8 +23,12 @@ from .common import (
     SLOTS,
     V_GAP,
 )
-from .horizontal import render_label as render_horizontal_label
-from .vertical import render_label as render_vertical_label
+from ..utils import binary_pdf_streams, rasterize_pdf, rasterize_pdf_images
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+_LabelDrawer = Callable[[canvas.Canvas, LabelContent, bool], None]
 
 
 class Orientation(StrEnum):
@@ -28,14 +36,67 @@ class Orientation(StrEnum):
     VERTICAL = "vertical"
 
 
+_ORIENTATION_BY_VALUE = {member.value: member for member in Orientation}
+
+
 class Outline(StrEnum):
     OFF = "off"
     ON = "on"
 
 
+# Option value -> whether the label outline is drawn.
+_OUTLINE_ENABLED = {member.value: member is Outline.ON for member in Outline}
+
+
+def _compute_slot_bounds(slot_index: int) -> tuple[float, float, float, float]:
+    """Return (left, bottom, right, top) of a sheet slot in page points."""
+
+    row = slot_index // COLS
+    col = slot_index % COLS
+
+    _, page_height = PAGE_SIZE
+
+    bottom = (
+        page_height
+        - MARGIN_TOP
+        - LABEL_H
+        - row * (LABEL_H + V_GAP)
+        + OFFSET_Y
+    )
+    top = bottom + LABEL_H
+    left = MARGIN_LEFT + col * (LABEL_W + H_GAP) + OFFSET_X
+    right = left + LABEL_W
+    return left, bottom, right, top
+
+
+def _drawer_for(orientation: Orientation) -> _LabelDrawer:
+    """Return the draw function for ``orientation``."""
+
+    # Deferred because each drawer module registers its fonts on import:
+    # listing options never builds fonts, and single-orientation runs
+    # never build the other orientation's.
+    if orientation is Orientation.VERTICAL:
+        from .vertical import draw_label as draw_vertical_label
+
+        return draw_vertical_label
+    from .horizontal import draw_label as draw_horizontal_label
+
+    return draw_horizontal_label
+
+
+# The sheet layout is fixed, so every slot geometry is built once; the
+# first slot of each sheet is the one that starts a new page.
+_SLOT_GEOMETRIES = tuple(
+    LabelGeometry(*_compute_slot_bounds(i), on_new_page=i == 0)
+    for i in range(SLOTS)
+)
+
+
 class Template(LabelTemplate):
     """Unified Avery 5163 template supporting per-label options."""
 
+    __slots__ = ("_slot_index",)
+
     _DEFAULT_ORIENTATION: Orientation = Orientation.HORIZONTAL
     _DEFAULT_OUTLINE: Outline = Outline.OFF
     _slot_index: int
@@ -64,43 +125,52 @@ class Template(LabelTemplate):
         self._slot_index = 0
 
     def next_label_geometry(self) -> LabelGeometry:
-        row = self._slot_index // COLS
-        col = self._slot_index % COLS
-
-        _, page_height = PAGE_SIZE
-
-        bottom = (
-            page_height
-            - MARGIN_TOP
-            - LABEL_H
-            - row * (LABEL_H + V_GAP)
-            + OFFSET_Y
-        )
-        top = bottom + LABEL_H
-        left = MARGIN_LEFT + col * (LABEL_W + H_GAP) + OFFSET_X
-        right = left + LABEL_W
-        on_new_page = self._slot_index == 0
+        geometry = _SLOT_GEOMETRIES[self._slot_index]
         self._slot_index = (self._slot_index + 1) % SLOTS
-
-        return LabelGeometry(left, bottom, right, top, on_new_page)
+        return geometry
 
     def render_label(self, content: LabelContent) -> bytes:
-        orientation = self._orientation_for_label(content)
-        outline = self._outline_for_label(content)
-        if orientation is Orientation.VERTICAL:
-            return render_vertical_label(content, outline, self.raster_dpi)
-        return render_horizontal_label(content, outline, self.raster_dpi)
+        return self.render_labels([content])[0]
+
+    def render_labels(self, contents: Sequence[LabelContent]) -> list[bytes]:
+        if not contents:
+            return []
+        return rasterize_pdf(*self._draw_labels(contents))
+
+    def render_label_images(self, contents: Sequence[LabelContent]) -> Iterator[Image.Image]:
+        if not contents:
+            return iter(())
+        return rasterize_pdf_images(*self._draw_labels(contents))
+
+    def _draw_labels(
+        self,
+        contents: Sequence[LabelContent],
+    ) -> tuple[bytes, int, list[bool]]:
+        """Return (PDF bytes, DPI, per-page rotate flags) for ``contents``.
+
+        Vertical pages are drawn upright and flagged for rotation.
+        """
+
+        # Every label becomes one page of a shared document, so fonts and
+        # the PDF itself are serialized and parsed once per batch.
+        buffer = BytesIO()
+        rotated: list[bool] = []
+        with binary_pdf_streams():
+            canvas_obj = canvas.Canvas(buffer)
+            for content in contents:
+                orientation = self._orientation_for_label(content)
+                drawer = _drawer_for(orientation)
+                drawer(canvas_obj, content, self._outline_for_label(content))
+                rotated.append(orientation is Orientation.VERTICAL)
+            canvas_obj.save()
+        return buffer.getvalue(), self.raster_dpi, rotated
 
     def _orientation_for_label(self, content: LabelContent) -> Orientation:
         options = content.template_options or {}
         value = (options.get("orientation") or self._DEFAULT_ORIENTATION.value).lower()
-        if value in Orientation._value2member_map_:
-            return Orientation(value)
-        return self._DEFAULT_ORIENTATION
+        return _ORIENTATION_BY_VALUE.get(value, self._DEFAULT_ORIENTATION)
 
     def _outline_for_label(self, content: LabelContent) -> bool:
         options = content.template_options or {}
         value = (options.get("outline") or self._DEFAULT_OUTLINE.value).lower()
-        if value in Outline._value2member_map_:
-            return Outline(value) is Outline.ON
-        return self._DEFAULT_OUTLINE is Outline.ON
+        return _OUTLINE_ENABLED.get(value, self._DEFAULT_OUTLINE is Outline.ON)
@@ -2,12 +2,8 @@
 
 from __future__ import annotations
 
-from io import BytesIO
-
-import fitz
-import qrcode
 from reportlab.lib.utils import ImageReader
-from reportlab.pdfbase.pdfmetrics import getAscent, getDescent, stringWidth
+from reportlab.pdfbase.pdfmetrics import getAscent, getDescent
 from reportlab.pdfgen import canvas
 
 from fonts import FontSpec, build_font_config
@@ -23,7 +19,10 @@ from .common import (
 )
 from ..utils import (
     center_baseline,
+    fit_prefix,
+    qr_image,
     shrink_fit,
+    string_width,
     wrap_text_to_width,
     wrap_text_to_width_multiline,
 )
@@ -36,69 +35,68 @@ _FONTS = build_font_config(
 )
 LABEL_BOLD_FONT = _FONTS.content.font_name
 LABEL_REG_FONT = _FONTS.label.font_name
+TITLE_FONT = _FONTS.title.font_name
+TITLE_SIZE = _FONTS.title.size
+CONTENT_FONT = _FONTS.content.font_name
+CONTENT_SIZE = _FONTS.content.size
+LABEL_SIZE = _FONTS.label.size
+CONTENT_ASCENT = getAscent(CONTENT_FONT) / 1000.0
+CONTENT_DESCENT = abs(getDescent(CONTENT_FONT)) / 1000.0
 
 
-def render_label(
+def draw_label(
+    canvas_obj: canvas.Canvas,
     content: LabelContent,
     outline: bool,
-    raster_dpi: int,
-) -> bytes:
-    buffer = BytesIO()
-    canvas_obj = canvas.Canvas(buffer, pagesize=(LABEL_W, LABEL_H))
+) -> None:
+    """Draw ``content`` as the next page of ``canvas_obj``."""
+
+    canvas_obj.setPageSize((LABEL_W, LABEL_H))
     _render_col_1(canvas_obj, content)
     _render_col_2(canvas_obj, content)
     if outline:
         _draw_outline(canvas_obj, LABEL_W, LABEL_H)
     canvas_obj.showPage()
-    canvas_obj.save()
-
-    pdf_bytes = buffer.getvalue()
-    with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
-        page = doc.load_page(0)
-        pix = page.get_pixmap(dpi=raster_dpi)
-        return pix.tobytes("png")
 
 
 def _render_col_1(canvas_obj: canvas.Canvas, content: LabelContent) -> None:
     title = content.display_id.strip() or "N/A"
     text_width = COL_1_W - 2 * LABEL_PADDING
-    title_max = _FONTS.title.size
+    title_max = TITLE_SIZE
     title_min = max(title_max * 0.5, 8.0)
     title_size = shrink_fit(
         title,
         text_width,
         max_font=title_max,
         min_font=title_min,
-        font_name=_FONTS.title.font_name,
+        font_name=TITLE_FONT,
     )
     center_x = COL_1_W / 2.0
-    canvas_obj.setFont(_FONTS.title.font_name, title_size)
+    canvas_obj.setFont(TITLE_FONT, title_size)
     canvas_obj.drawCentredString(center_x, COL_1_BOTTOM_PAD, title)
 
     title_top = COL_1_BOTTOM_PAD + title_size
 
-    buffer = BytesIO()
-    qr = qrcode.QRCode(border=0)
-    qr.add_data(content.url)
-    qr_img = qr.make_image()
-    qr_img.save(buffer, kind="PNG")
-    buffer.seek(0)
-
-    canvas_obj.drawImage(
-        ImageReader(buffer),
-        LABEL_PADDING,
-        title_top,
-        width=QR_SIZE,
-        height=QR_SIZE,
-        preserveAspectRatio=True,
-        mask="auto",
-    )
+    if content.url:
+        canvas_obj.drawImage(
+            ImageReader(qr_image(content.url)),
+            LABEL_PADDING,
+            title_top,
+            width=QR_SIZE,
+            height=QR_SIZE,
+            preserveAspectRatio=True,
+            mask="auto",
+        )
 
 
 def _render_col_2(canvas_obj: canvas.Canvas, content: LabelContent) -> None:
     content_row_y = LABEL_H * 3 / 4
-    canvas_obj.line(COL_1_W, 0, COL_1_W, LABEL_H)
-    canvas_obj.line(COL_1_W, content_row_y, LABEL_W, content_row_y)
+    canvas_obj.lines(
+        [
+            (COL_1_W, 0, COL_1_W, LABEL_H),
+            (COL_1_W, content_row_y, LABEL_W, content_row_y),
+        ]
+    )
 
     text_start_x = COL_1_W + LABEL_PADDING
     text_max_width = COL_2_W - 2 * LABEL_PADDING
@@ -106,29 +104,29 @@ def _render_col_2(canvas_obj: canvas.Canvas, content: LabelContent) -> None:
     content_text = content.name.strip()
     if content_text:
         max_height = LABEL_H - content_row_y - LABEL_PADDING
-        content_min = max(_FONTS.content.size * 0.5, 6.0)
+        content_min = max(CONTENT_SIZE * 0.5, 6.0)
         lines, chosen_size = wrap_text_to_width_multiline(
             text=content_text,
-            font_name=_FONTS.content.font_name,
-            font_size=_FONTS.content.size,
+            font_name=CONTENT_FONT,
+            font_size=CONTENT_SIZE,
             max_width_pt=text_max_width,
             max_height_pt=max_height,
             min_font_size=content_min,
             step=0.5,
         )
         if lines:
-            ascent = getAscent(_FONTS.content.font_name) / 1000.0 * chosen_size
-            descent = abs(getDescent(_FONTS.content.font_name)) / \
-                1000.0 * chosen_size
+            ascent = CONTENT_ASCENT * chosen_size
+            descent = CONTENT_DESCENT * chosen_size
             line_height = ascent + descent
             block_height = len(lines) * line_height
             region_top = LABEL_H - LABEL_PADDING
             offset = max((max_height - block_height) / 2.0, 0.0)
             baseline = region_top - offset - ascent
-            canvas_obj.setFont(_FONTS.content.font_name, chosen_size)
+            text_obj = canvas_obj.beginText(text_start_x, baseline)
+            text_obj.setFont(CONTENT_FONT, chosen_size, leading=line_height)
             for line in lines:
-                canvas_obj.drawString(text_start_x, baseline, line)
-                baseline -= line_height
+                text_obj.textLine(line)
+            canvas_obj.drawText(text_obj)
 
     panel_top = content_row_y - LABEL_PADDING
     panel_bottom = LABEL_PADDING
@@ -136,17 +134,15 @@ def _render_col_2(canvas_obj: canvas.Canvas, content: LabelContent) -> None:
 
     labels_text = ", ".join(content.labels).strip()
     if labels_text and panel_top > panel_bottom:
-        label_lines = list(
-            wrap_text_to_width(
-                text=labels_text,
-                font_name=LABEL_BOLD_FONT,
-                font_size=_FONTS.label.size,
-                max_width_pt=text_max_width,
-            )
+        label_lines = wrap_text_to_width(
+            text=labels_text,
+            font_name=LABEL_BOLD_FONT,
+            font_size=LABEL_SIZE,
+            max_width_pt=text_max_width,
         )
         baseline = center_baseline(
             line_count=len(label_lines),
-            font_size=_FONTS.label.size,
+            font_size=LABEL_SIZE,
             area_top=panel_top,
             area_bottom=panel_mid,
             gap=LABEL_PADDING / 2.0,
@@ -162,17 +158,15 @@ def _render_col_2(canvas_obj: canvas.Canvas, content: LabelContent) -> None:
 
     description = content.description.strip()
     if description and panel_mid > panel_bottom:
-        desc_lines = list(
-            wrap_text_to_width(
-                text=description,
-                font_name=LABEL_REG_FONT,
-                font_size=_FONTS.label.size,
-                max_width_pt=text_max_width,
-            )
+        desc_lines = wrap_text_to_width(
+            text=description,
+            font_name=LABEL_REG_FONT,
+            font_size=LABEL_SIZE,
+            max_width_pt=text_max_width,
         )
         baseline = center_baseline(
             line_count=len(desc_lines),
-            font_size=_FONTS.label.size,
+            font_size=LABEL_SIZE,
             area_top=panel_mid,
             area_bottom=panel_bottom,
             gap=LABEL_PADDING / 2.0,
@@ -195,26 +189,20 @@ def _draw_text_block(
     text_max_width: float,
     font_name: str,
 ) -> float:
-    text = text.strip()
-    if not text or baseline < _FONTS.label.size:
+    # Callers pass text already stripped from the label content.
+    if not text or baseline < LABEL_SIZE:
         return baseline
 
-    font_size = _FONTS.label.size
-    lines = list(
-        wrap_text_to_width(
-            text=text,
-            font_name=font_name,
-            font_size=font_size,
-            max_width_pt=text_max_width,
-        )
+    font_size = LABEL_SIZE
+    lines = wrap_text_to_width(
+        text=text,
+        font_name=font_name,
+        font_size=font_size,
+        max_width_pt=text_max_width,
     )
     if not lines:
         return baseline
 
-    normalized = " ".join(text.split())
-    reconstructed = " ".join(lines)
-    truncated_wrap = reconstructed.strip() != normalized.strip()
-
     line_gap = font_size + (LABEL_PADDING / 2.0)
     probe = baseline
     visible_lines: list[str] = []
@@ -227,16 +215,21 @@ def _draw_text_block(
     if not visible_lines:
         return baseline
 
-    truncated_space = len(visible_lines) < len(lines)
-    truncated = truncated_wrap or truncated_space
+    # Only rebuild the text to detect split words when every line fits.
+    truncated = len(visible_lines) < len(lines) or (
+        " ".join(lines) != " ".join(text.split())
+    )
 
     if truncated:
         ellipsis = "…"
-        ell_width = stringWidth(ellipsis, font_name, font_size)
+        ell_width = string_width(ellipsis, font_name, font_size)
         if ell_width <= text_max_width:
-            last = visible_lines[-1].rstrip()
-            while last and stringWidth(last + ellipsis, font_name, font_size) > text_max_width:
-                last = last[:-1]
+            last = fit_prefix(
+                visible_lines[-1].rstrip(),
+                font_name,
+                font_size,
+                text_max_width - ell_width,
+            )
             if last:
                 visible_lines[-1] = last + ellipsis
             else:
@@ -244,18 +237,19 @@ def _draw_text_block(
                     ellipsis if ell_width <= text_max_width else visible_lines[-1]
                 )
 
+    # Every visible line already clears the bottom (see the probe above), so
+    # the block is emitted as one text object stepping down by the leading.
     current = baseline
+    text_obj = canvas_obj.beginText(text_start_x, baseline)
+    text_obj.setFont(font_name, font_size, leading=line_gap)
     for line in visible_lines:
-        if current < font_size:
-            break
-        canvas_obj.setFont(font_name, font_size)
-        canvas_obj.drawString(text_start_x, current, line.rstrip())
+        text_obj.textLine(line.rstrip())
         current -= line_gap
+    canvas_obj.drawText(text_obj)
     return current
 
 
 def _draw_outline(canvas_obj: canvas.Canvas, width: float, height: float) -> None:
-    canvas_obj.saveState()
+    # No save/restore: this is the last draw before showPage resets the state.
     canvas_obj.setLineWidth(0.75)
     canvas_obj.rect(0, 0, width, height)
-    canvas_obj.restoreState()
@@ -2,11 +2,6 @@
 
 from __future__ import annotations
 
-from io import BytesIO
-
-import fitz
-import qrcode
-from PIL import Image
 from reportlab.lib.utils import ImageReader
 from reportlab.pdfbase.pdfmetrics import getAscent, getDescent
 from reportlab.pdfgen import canvas
@@ -21,7 +16,12 @@ from .common import (
     VERT_QR_SIZE,
     VERT_SECTION_GAP,
 )
-from ..utils import shrink_fit, wrap_text_to_width_multiline
+from ..utils import (
+    qr_image,
+    shrink_fit,
+    string_width,
+    wrap_text_to_width_multiline,
+)
 
 _V_FONTS = build_font_config(
     family="Inter",
@@ -32,15 +32,21 @@ _V_FONTS = build_font_config(
 VERT_TITLE_FONT = _V_FONTS.title
 VERT_CONTENT_FONT = _V_FONTS.content
 VERT_LABEL_FONT = _V_FONTS.label
+VERT_CONTENT_ASCENT = getAscent(VERT_CONTENT_FONT.font_name) / 1000.0
+VERT_CONTENT_DESCENT = abs(getDescent(VERT_CONTENT_FONT.font_name)) / 1000.0
 
 
-def render_label(
+def draw_label(
+    canvas_obj: canvas.Canvas,
     content: LabelContent,
     outline: bool,
-    raster_dpi: int,
-) -> bytes:
-    buffer = BytesIO()
-    canvas_obj = canvas.Canvas(buffer, pagesize=(LABEL_H, LABEL_W))
+) -> None:
+    """Draw ``content`` as the next page of ``canvas_obj``.
+
+    The page is laid out upright; callers rotate it when rasterizing.
+    """
+
+    canvas_obj.setPageSize((LABEL_H, LABEL_W))
 
     bottom = _render_row_1(canvas_obj, content)
     bottom = _render_row_2(canvas_obj, content, bottom)
@@ -50,19 +56,6 @@ def render_label(
         _draw_outline(canvas_obj, LABEL_H, LABEL_W)
 
     canvas_obj.showPage()
-    canvas_obj.save()
-
-    pdf_bytes = buffer.getvalue()
-    with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
-        page = doc.load_page(0)
-        pix = page.get_pixmap(dpi=raster_dpi)
-        original_png = pix.tobytes("png")
-
-    with Image.open(BytesIO(original_png)) as img:
-        rotated = img.rotate(90, expand=True)
-        output = BytesIO()
-        rotated.save(output, format="PNG")
-        return output.getvalue()
 
 
 def _render_row_1(canvas_obj: canvas.Canvas, content: LabelContent) -> float:
@@ -71,22 +64,16 @@ def _render_row_1(canvas_obj: canvas.Canvas, content: LabelContent) -> float:
 
     qr_bottom = height - VERT_QR_SIZE - VERT_LABEL_PADDING
 
-    qr_buffer = BytesIO()
-    qr = qrcode.QRCode(border=0)
-    qr.add_data(content.url)
-    qr_img = qr.make_image()
-    qr_img.save(qr_buffer, kind="PNG")
-    qr_buffer.seek(0)
-
-    canvas_obj.drawImage(
-        ImageReader(qr_buffer),
-        (width - VERT_QR_SIZE) / 2,
-        qr_bottom,
-        width=VERT_QR_SIZE,
-        height=VERT_QR_SIZE,
-        preserveAspectRatio=True,
-        mask="auto",
-    )
+    if content.url:
+        canvas_obj.drawImage(
+            ImageReader(qr_image(content.url)),
+            (width - VERT_QR_SIZE) / 2,
+            qr_bottom,
+            width=VERT_QR_SIZE,
+            height=VERT_QR_SIZE,
+            preserveAspectRatio=True,
+            mask="auto",
+        )
 
     title = content.display_id.strip() or "N/A"
     title_width = width - 2 * VERT_LABEL_PADDING
@@ -126,25 +113,24 @@ def _render_row_2(canvas_obj: canvas.Canvas, content: LabelContent, top: float)
         )
 
         if chosen_lines:
-            canvas_obj.setFont(content_font.font_name, chosen_size)
-            ascent = (
-                getAscent(content_font.font_name)
-                / 1000.0
-                * chosen_size
-            )
-            descent = (
-                abs(getDescent(content_font.font_name))
-                / 1000.0
-                * chosen_size
-            )
+            ascent = VERT_CONTENT_ASCENT * chosen_size
+            descent = VERT_CONTENT_DESCENT * chosen_size
             line_height = (ascent + descent) * 0.9
             block_height = len(chosen_lines) * line_height
             offset = max((region_height - block_height) / 2.0, 0.0)
             top_of_block = top - offset
             baseline = top_of_block - ascent
+            placed: list[tuple[float, str]] = []
             for line in chosen_lines:
-                canvas_obj.drawCentredString(width / 2.0, baseline, line)
+                placed.append((baseline, line))
                 baseline -= line_height
+            _draw_centred_lines(
+                canvas_obj,
+                content_font.font_name,
+                chosen_size,
+                width / 2.0,
+                placed,
+            )
 
     canvas_obj.line(0, bottom, LABEL_H, bottom)
     return bottom
@@ -174,15 +160,43 @@ def _render_row_3(canvas_obj: canvas.Canvas, content: LabelContent, height: floa
         if not lines:
             continue
 
-        canvas_obj.setFont(VERT_LABEL_FONT.font_name, line_size)
+        placed: list[tuple[float, str]] = []
         for line in lines:
             info_cursor -= line_size
-            canvas_obj.drawCentredString(width / 2.0, info_cursor, line)
+            placed.append((info_cursor, line))
+        _draw_centred_lines(
+            canvas_obj,
+            VERT_LABEL_FONT.font_name,
+            line_size,
+            width / 2.0,
+            placed,
+        )
         info_cursor -= VERT_LINE_GAP
 
 
+def _draw_centred_lines(
+    canvas_obj: canvas.Canvas,
+    font_name: str,
+    font_size: float,
+    center_x: float,
+    placed: list[tuple[float, str]],
+) -> None:
+    """Draw each (baseline, line) pair centred on ``center_x``.
+
+    All lines share one text object, so the font is set once and widths come
+    from the cached glyph table instead of one ``drawCentredString`` each.
+    """
+
+    text_obj = canvas_obj.beginText()
+    text_obj.setFont(font_name, font_size)
+    for baseline, line in placed:
+        line_width = string_width(line, font_name, font_size)
+        text_obj.setTextOrigin(center_x - line_width / 2.0, baseline)
+        text_obj.textOut(line)
+    canvas_obj.drawText(text_obj)
+
+
 def _draw_outline(canvas_obj: canvas.Canvas, width: float, height: float) -> None:
-    canvas_obj.saveState()
+    # No save/restore: this is the last draw before showPage resets the state.
     canvas_obj.setLineWidth(0.75)
     canvas_obj.rect(0, 0, width, height)
-    canvas_obj.restoreState()
@@ -4,9 +4,14 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from io import BytesIO
+from typing import TYPE_CHECKING, Iterator, Sequence
 
 from label_templates.label_types import LabelContent, LabelGeometry
 
+if TYPE_CHECKING:
+    from PIL import Image
+
 
 @dataclass(frozen=True)
 class TemplateOption:
@@ -19,6 +24,8 @@ class TemplateOption:
 class LabelTemplate(ABC):
     """Defines the stateful interface all label templates must implement."""
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         self.reset()
 
@@ -50,6 +57,32 @@ class LabelTemplate(ABC):
     ) -> bytes:
         """Return PNG bytes for ``content`` rendered in the next slot."""
 
+    def render_labels(
+        self,
+        contents: Sequence[LabelContent],
+    ) -> list[bytes]:
+        """Return PNG bytes for each of ``contents``, in order.
+
+        Templates may override this to share rendering work across a batch.
+        """
+
+        return [self.render_label(content) for content in contents]
+
+    def render_label_images(
+        self,
+        contents: Sequence[LabelContent],
+    ) -> Iterator[Image.Image]:
+        """Yield rasterized images for each of ``contents``, in order.
+
+        Used when labels are composed into another document; templates may
+        override this to skip the PNG encoding of ``render_labels``.
+        """
+
+        from PIL import Image
+
+        for png in self.render_labels(contents):
+            yield Image.open(BytesIO(png))
+
     def available_options(self) -> list[TemplateOption]:
         """Return user-tunable options supported by the template."""
 
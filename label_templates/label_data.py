@@ -32,7 +32,10 @@ def locations_to_label_contents(
     base_ui: str,
 ) -> list[LabelContent]:
     base_ui_clean = base_ui.rstrip("/")
-    return [location_to_label_content(loc, base_ui_clean) for loc in locations]
+    return [
+        _location_to_label_content(loc, build_ui_url(base_ui_clean, loc.id))
+        for loc in locations
+    ]
 
 
 def assets_to_label_contents(
@@ -40,15 +43,33 @@ def assets_to_label_contents(
     base_ui: str,
 ) -> list[LabelContent]:
     base_ui_clean = base_ui.rstrip("/")
-    return [asset_to_label_content(asset, base_ui_clean) for asset in assets]
+    return [
+        _asset_to_label_content(
+            asset,
+            build_asset_ui_url(base_ui_clean, asset.id),
+        )
+        for asset in assets
+    ]
 
 
 def location_to_label_content(loc: Location, base_ui: str) -> LabelContent:
     base_ui_clean = base_ui.rstrip("/")
+    return _location_to_label_content(loc, build_ui_url(base_ui_clean, loc.id))
+
+
+def asset_to_label_content(asset: Asset, base_ui: str) -> LabelContent:
+    base_ui_clean = base_ui.rstrip("/")
+    return _asset_to_label_content(
+        asset,
+        build_asset_ui_url(base_ui_clean, asset.id),
+    )
+
+
+def _location_to_label_content(loc: Location, url: str) -> LabelContent:
     return LabelContent(
         display_id=loc.display_id,
         name=loc.name,
-        url=build_ui_url(base_ui_clean, loc.id),
+        url=url,
         id=loc.id,
         parent=loc.parent,
         labels=loc.labels,
@@ -56,12 +77,11 @@ def location_to_label_content(loc: Location, base_ui: str) -> LabelContent:
     )
 
 
-def asset_to_label_content(asset: Asset, base_ui: str) -> LabelContent:
-    base_ui_clean = base_ui.rstrip("/")
+def _asset_to_label_content(asset: Asset, url: str) -> LabelContent:
     return LabelContent(
         display_id=asset.display_id,
         name=asset.name,
-        url=build_asset_ui_url(base_ui_clean, asset.id),
+        url=url,
         id=asset.id,
         parent=asset.location,
         labels=asset.labels,
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-from io import BytesIO
 from typing import Sequence
 
 from reportlab.lib.utils import ImageReader
@@ -42,9 +41,7 @@ def _render_png(
     if len(labels) == 0:
         return "No labels matched the provided filters; no output generated."
 
-    for i, label in enumerate(labels):
-        png_bytes = template.render_label(label)
-
+    for i, png_bytes in enumerate(template.render_labels(labels)):
         png_name = f"{output_path}_{(i + 1):02d}.png"
         with open(png_name, "wb") as handle:
             handle.write(png_bytes)
@@ -75,7 +72,9 @@ def _render_pdf(
             else:
                 canvas_obj.showPage()
 
-    for label in labels:
+    # Images are drawn as they are rasterized, so only one label's bitmap
+    # is held at a time.
+    for image in template.render_label_images(labels):
         geometry = template.next_label_geometry()
         if geometry.on_new_page:
             if first_page:
@@ -88,8 +87,7 @@ def _render_pdf(
                 "Template produced non-positive geometry dimensions."
             )
 
-        png_bytes = template.render_label(label)
-        image_reader = ImageReader(BytesIO(png_bytes))
+        image_reader = ImageReader(image)
         canvas_obj.drawImage(
             image_reader,
             geometry.left,
@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LabelContent:
     """Textual payload to render into a label."""
 
@@ -17,7 +17,7 @@ class LabelContent:
     template_options: dict[str, str] | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LabelGeometry:
     left: float
     bottom: float
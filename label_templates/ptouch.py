@@ -4,18 +4,24 @@ from __future__ import annotations
 
 from io import BytesIO
 from enum import StrEnum
+from functools import lru_cache
+from typing import Sequence
 
-import fitz
-import qrcode
 from reportlab.lib.units import mm
 from reportlab.lib.utils import ImageReader
-from reportlab.pdfbase.pdfmetrics import stringWidth
 from reportlab.pdfgen import canvas
 
-from fonts import FontSpec, build_font_config
+from fonts import FontConfig, FontSpec, build_font_config
 from label_templates.label_types import LabelContent, LabelGeometry
 from .base import LabelTemplate, TemplateOption
-from .utils import shrink_fit, wrap_text_to_width_multiline
+from .utils import (
+    binary_pdf_streams,
+    qr_image,
+    rasterize_pdf,
+    shrink_fit,
+    string_width,
+    wrap_text_to_width_multiline,
+)
 
 LABEL_HEIGHT = 18 * mm
 QR_TEXT_GAP = 1 * mm
@@ -26,16 +32,25 @@ MAX_WIDTH = 75 * mm
 MIN_WIDTH = 30 * mm
 TEXT_GAP = 1 * mm
 
+# The QR spans the tape height; text starts after it on normal labels.
+QR_SIZE = LABEL_HEIGHT
+TEXT_LEFT = LABEL_MARGIN_LEFT + QR_SIZE + QR_TEXT_GAP
+
 FONT_SIZE_TITLE = 14
 MAX_FONT_SIZE_CONTENT = 24
 MIN_FONT_SIZE_CONTENT = 10
 
-_FONTS = build_font_config(
-    family="Inter",
-    title_spec=FontSpec(weight=600, size=FONT_SIZE_TITLE),
-    content_spec=FontSpec(weight=400, size=MAX_FONT_SIZE_CONTENT),
-    label_spec=FontSpec(weight=400, size=12),
-)
+
+@lru_cache(maxsize=1)
+def _fonts() -> FontConfig:
+    """Build the template fonts on first render rather than at import."""
+
+    return build_font_config(
+        family="Inter",
+        title_spec=FontSpec(weight=600, size=FONT_SIZE_TITLE),
+        content_spec=FontSpec(weight=400, size=MAX_FONT_SIZE_CONTENT),
+        label_spec=FontSpec(weight=400, size=12),
+    )
 
 
 class TypeOption(StrEnum):
@@ -43,9 +58,14 @@ class TypeOption(StrEnum):
     MINIMAL = "minimal"
 
 
+_TYPE_BY_VALUE = {member.value: member for member in TypeOption}
+
+
 class Template(LabelTemplate):
     """Stateful template for Brother P-Touch continuous tape."""
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__()
 
@@ -72,54 +92,76 @@ class Template(LabelTemplate):
         self,
         content: LabelContent,
     ) -> bytes:  # type: ignore[override]
-        t = self._type_for_label(content)
+        return self.render_labels([content])[0]
 
-        if t is TypeOption.MINIMAL:
-            return self._render_minimal(content)
+    def render_labels(
+        self,
+        contents: Sequence[LabelContent],
+    ) -> list[bytes]:
+        if not contents:
+            return []
+        return rasterize_pdf(*self._draw_labels(contents))
 
-        width = self._compute_width(content)
+    def _draw_labels(
+        self,
+        contents: Sequence[LabelContent],
+    ) -> tuple[bytes, int, list[bool]]:
+        """Return (PDF bytes, DPI, per-page rotate flags) for ``contents``.
+
+        Minimal pages are drawn upright and flagged for rotation.
+        """
 
+        # One page per label in a shared document.
         buffer = BytesIO()
-        canvas_obj = canvas.Canvas(buffer, pagesize=(width, LABEL_HEIGHT))
+        rotated: list[bool] = []
+        with binary_pdf_streams():
+            canvas_obj = canvas.Canvas(buffer)
+            for content in contents:
+                if self._type_for_label(content) is TypeOption.MINIMAL:
+                    self._draw_minimal(canvas_obj, content)
+                    rotated.append(True)
+                else:
+                    self._draw_normal(canvas_obj, content)
+                    rotated.append(False)
+            canvas_obj.save()
+        return buffer.getvalue(), self.raster_dpi, rotated
+
+    def _draw_normal(self, canvas_obj: canvas.Canvas, content: LabelContent) -> None:
+        fonts = _fonts()
+        width = self._compute_width(content)
+        canvas_obj.setPageSize((width, LABEL_HEIGHT))
 
-        qr_size = LABEL_HEIGHT
         text_area_width = (
             width
-            - qr_size
+            - QR_SIZE
             - QR_TEXT_GAP
             - LABEL_MARGIN_LEFT
             - LABEL_MARGIN_RIGHT
         )
 
-        qr_buffer = BytesIO()
-        qr = qrcode.QRCode(border=0)
-        qr.add_data(content.url)
-        qr_img = qr.make_image()
-        qr_img.save(qr_buffer, kind="PNG")
-        qr_buffer.seek(0)
-
-        canvas_obj.drawImage(
-            ImageReader(qr_buffer),
-            LABEL_MARGIN_LEFT,
-            0,
-            width=qr_size,
-            height=qr_size,
-            preserveAspectRatio=True,
-            mask="auto",
-        )
+        if content.url:
+            canvas_obj.drawImage(
+                ImageReader(qr_image(content.url)),
+                LABEL_MARGIN_LEFT,
+                0,
+                width=QR_SIZE,
+                height=QR_SIZE,
+                preserveAspectRatio=True,
+                mask="auto",
+            )
 
-        text_left = LABEL_MARGIN_LEFT + QR_TEXT_GAP + qr_size
+        title_font = fonts.title
         title = content.display_id.strip() or "Unnamed"
         title_size = shrink_fit(
             title,
             text_area_width,
-            max_font=_FONTS.title.size,
-            min_font=max(_FONTS.title.size * 0.5, 6.0),
-            font_name=_FONTS.title.font_name,
+            max_font=title_font.size,
+            min_font=max(title_font.size * 0.5, 6.0),
+            font_name=title_font.font_name,
         )
         title_baseline = LABEL_HEIGHT - title_size
-        canvas_obj.setFont(_FONTS.title.font_name, title_size)
-        canvas_obj.drawString(text_left, title_baseline, title)
+        canvas_obj.setFont(title_font.font_name, title_size)
+        canvas_obj.drawString(TEXT_LEFT, title_baseline, title)
 
         body_text = content.name.strip()
         if body_text:
@@ -130,51 +172,41 @@ class Template(LabelTemplate):
                 available_height,
             )
             if body_lines:
-                canvas_obj.setFont(_FONTS.content.font_name, body_size)
+                canvas_obj.setFont(fonts.content.font_name, body_size)
                 first_baseline = title_baseline - TEXT_GAP - body_size
-                canvas_obj.drawString(text_left, first_baseline, body_lines[0])
+                canvas_obj.drawString(TEXT_LEFT, first_baseline, body_lines[0])
                 if len(body_lines) > 1:
                     second_baseline = first_baseline - TEXT_GAP - body_size
                     canvas_obj.drawString(
-                        text_left,
+                        TEXT_LEFT,
                         second_baseline,
                         body_lines[1],
                     )
 
         canvas_obj.showPage()
-        canvas_obj.save()
-
-        pdf_bytes = buffer.getvalue()
-        with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
-            page = doc.load_page(0)
-            pix = page.get_pixmap(dpi=self.raster_dpi)
-            return pix.tobytes("png")
 
     def _compute_width(self, label: LabelContent) -> float:
-        qr_size = LABEL_HEIGHT
-        text_lines = [
-            label.display_id.strip() or "",
-            label.name.strip() or "",
-            ", ".join(label.labels).strip() or "",
-        ]
-
-        font_cycle = [
-            (_FONTS.title.font_name, _FONTS.title.size),
-            (_FONTS.content.font_name, _FONTS.content.size),
-            (_FONTS.label.font_name, _FONTS.label.size),
-        ]
+        fonts = _fonts()
+        text_lines = (
+            (label.display_id.strip(), fonts.title),
+            (label.name.strip(), fonts.content),
+            (", ".join(label.labels).strip(), fonts.label),
+        )
 
-        text_widths: list[float] = []
-        for idx, line in enumerate(text_lines):
+        desired_text_width = 0.0
+        for line, font in text_lines:
             if not line:
-                text_widths.append(0.0)
                 continue
-            font_name, font_size = font_cycle[min(idx, len(font_cycle) - 1)]
-            text_widths.append(stringWidth(line, font_name, font_size))
+            desired_text_width = max(
+                desired_text_width,
+                string_width(line, font.font_name, font.size),
+            )
+            required = TEXT_LEFT + desired_text_width + LABEL_MARGIN_RIGHT
+            # The width is capped, so the remaining lines cannot change it.
+            if required >= MAX_WIDTH:
+                return MAX_WIDTH
 
-        desired_text_width = max(text_widths + [0])
-        required = LABEL_MARGIN_LEFT + qr_size + QR_TEXT_GAP + \
-            desired_text_width + LABEL_MARGIN_RIGHT
+        required = TEXT_LEFT + desired_text_width + LABEL_MARGIN_RIGHT
         return min(max(required, MIN_WIDTH), MAX_WIDTH)
 
     def _wrap_content_lines(
@@ -183,111 +215,69 @@ class Template(LabelTemplate):
         max_width: float,
         max_height: float,
     ) -> tuple[list[str], float]:
-        """Return up to two lines that satisfy width and height limits."""
-
-        stripped = text.strip()
-        if not stripped:
-            return [], _FONTS.content.size
-
-        attempt_size = MAX_FONT_SIZE_CONTENT
-        step = 0.5
-
-        while attempt_size >= MIN_FONT_SIZE_CONTENT:
-            lines, chosen_size = wrap_text_to_width_multiline(
-                text=stripped,
-                font_name=_FONTS.content.font_name,
-                font_size=attempt_size,
-                max_width_pt=max_width,
-                max_height_pt=max_height,
-                min_font_size=MIN_FONT_SIZE_CONTENT,
-                step=step,
-            )
-            if lines:
-                return lines[:2], chosen_size
-                attempt_size = chosen_size
-
-            attempt_size -= step
+        """Return up to two lines of stripped ``text`` within width and height limits."""
+
+        content_font = _fonts().content
+        if not text:
+            return [], content_font.size
+
+        # The wrapper already steps the size down from the maximum until the
+        # text fits, and only comes back empty for a degenerate area, which
+        # no smaller starting size would change.
+        lines, chosen_size = wrap_text_to_width_multiline(
+            text=text,
+            font_name=content_font.font_name,
+            font_size=MAX_FONT_SIZE_CONTENT,
+            max_width_pt=max_width,
+            max_height_pt=max_height,
+            min_font_size=MIN_FONT_SIZE_CONTENT,
+            step=0.5,
+        )
+        if lines:
+            return lines[:2], chosen_size
 
         fallback_size = max(
             MIN_FONT_SIZE_CONTENT,
             min(max_height, MAX_FONT_SIZE_CONTENT),
         )
-        return ([stripped], fallback_size)
+        return ([text], fallback_size)
 
     def _type_for_label(self, content: LabelContent) -> TypeOption:
         options = content.template_options or {}
         value = (options.get("type") or TypeOption.NORMAL.value).lower()
-        if value in TypeOption._value2member_map_:
-            return TypeOption(value)
-        return TypeOption.NORMAL
+        return _TYPE_BY_VALUE.get(value, TypeOption.NORMAL)
 
-    # Minimal rendering: only QR + display_id, then rotate output 90° clockwise.
-    def _render_minimal(self, content: LabelContent) -> bytes:
+    # Minimal rendering: only QR + display_id; the page is rotated 90° when rasterized.
+    def _draw_minimal(self, canvas_obj: canvas.Canvas, content: LabelContent) -> None:
 
+        title_font = _fonts().title
         title = content.display_id.strip() or "N/A"
         title_size = shrink_fit(
             title,
             LABEL_HEIGHT,
-            max_font=_FONTS.title.size,
-            min_font=max(_FONTS.title.size * 0.5, 6.0),
-            font_name=_FONTS.title.font_name,
-        )
-        width = LABEL_HEIGHT
-        qr_size = width
-        height = LABEL_MARGIN_LEFT + qr_size + title_size + LABEL_MARGIN_RIGHT
-
-        buffer = BytesIO()
-        canvas_obj = canvas.Canvas(buffer, pagesize=(width, height))
-
-        qr_buffer = BytesIO()
-        qr = qrcode.QRCode(border=0)
-        qr.add_data(content.url)
-        qr_img = qr.make_image()
-        qr_img.save(qr_buffer, kind="PNG")
-        qr_buffer.seek(0)
-
-        qr_bottom = height - LABEL_MARGIN_LEFT - qr_size
-        # Draw QR on the left
-        canvas_obj.drawImage(
-            ImageReader(qr_buffer),
-            0,
-            qr_bottom,
-            width=qr_size,
-            height=qr_size,
-            preserveAspectRatio=True,
-            mask="auto",
+            max_font=title_font.size,
+            min_font=max(title_font.size * 0.5, 6.0),
+            font_name=title_font.font_name,
         )
+        height = LABEL_MARGIN_LEFT + QR_SIZE + title_size + LABEL_MARGIN_RIGHT
+
+        canvas_obj.setPageSize((LABEL_HEIGHT, height))
+
+        qr_bottom = height - LABEL_MARGIN_LEFT - QR_SIZE
+        if content.url:
+            # Draw QR on the left
+            canvas_obj.drawImage(
+                ImageReader(qr_image(content.url)),
+                0,
+                qr_bottom,
+                width=QR_SIZE,
+                height=QR_SIZE,
+                preserveAspectRatio=True,
+                mask="auto",
+            )
 
         title_baseline = qr_bottom - title_size
-        canvas_obj.setFont(_FONTS.title.font_name, title_size)
+        canvas_obj.setFont(title_font.font_name, title_size)
         canvas_obj.drawString(0, title_baseline, title)
 
         canvas_obj.showPage()
-        canvas_obj.save()
-
-        # Rasterize to PNG then rotate 90 degrees
-        pdf_bytes = buffer.getvalue()
-        with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
-            page = doc.load_page(0)
-            pix = page.get_pixmap(dpi=self.raster_dpi)
-            png_bytes = pix.tobytes("png")
-
-        try:
-            from PIL import Image  # Pillow is in requirements
-        except Exception:
-            # Fallback: return unrotated if Pillow is not available
-            return png_bytes
-
-        img = Image.open(BytesIO(png_bytes))
-        rotated = img.rotate(90, expand=True)
-        out = BytesIO()
-        rotated.save(out, format="PNG")
-        return out.getvalue()
-
-    def _compute_width_minimal(self, title: str) -> float:
-        qr_size = LABEL_HEIGHT
-        text_width = stringWidth(
-            title, _FONTS.title.font_name, _FONTS.title.size)
-        required = LABEL_MARGIN_LEFT + qr_size + \
-            QR_TEXT_GAP + text_width + LABEL_MARGIN_RIGHT
-        return min(max(required, MIN_WIDTH), MAX_WIDTH)
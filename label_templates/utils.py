@@ -2,10 +2,64 @@
 
 from __future__ import annotations
 
-from typing import Iterable
+import math
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterator, Sequence
 
+from reportlab import rl_config
 from reportlab.pdfbase.pdfmetrics import stringWidth
 
+if TYPE_CHECKING:
+    import fitz
+    from PIL import Image
+
+# Per-font glyph advances in 1/1000 em, filled lazily by ``string_width``.
+_GLYPH_WIDTHS: dict[str, dict[str, float]] = {}
+
+# Estimated line height, as a multiple of the font size, for multiline wraps.
+_LINE_HEIGHT_FACTOR = 1.2
+
+
+def string_width(text: str, font_name: str, font_size: float) -> float:
+    """Return the width of ``text`` in points using cached glyph advances.
+
+    Matches ``stringWidth`` (up to float rounding) for the fonts used here,
+    which have no kerning, but each glyph is measured through ReportLab only
+    once per font.
+    """
+
+    return 0.001 * font_size * _advance_total(text, font_name)
+
+
+def _advance_total(text: str, font_name: str) -> float:
+    """Return the summed glyph advances of ``text`` in 1/1000 em."""
+
+    widths = _GLYPH_WIDTHS.setdefault(font_name, {})
+    total = 0.0
+    for ch in text:
+        advance = widths.get(ch)
+        if advance is None:
+            advance = widths[ch] = stringWidth(ch, font_name, 1000)
+        total += advance
+    return total
+
+
+def fit_prefix(text: str, font_name: str, font_size: float, max_width: float) -> str:
+    """Return the longest prefix of ``text`` no wider than ``max_width``."""
+
+    widths = _GLYPH_WIDTHS.setdefault(font_name, {})
+    limit = max_width * 1000.0 / font_size if font_size > 0 else 0.0
+    total = 0.0
+    for index, ch in enumerate(text):
+        advance = widths.get(ch)
+        if advance is None:
+            advance = widths[ch] = stringWidth(ch, font_name, 1000)
+        total += advance
+        if total > limit:
+            return text[:index]
+    return text
+
 
 def wrap_text_to_width_multiline(
     text: str,
@@ -22,99 +76,140 @@ def wrap_text_to_width_multiline(
     Returns ``(lines, chosen_font_size)``.
     """
 
+    lines, size = _wrap_multiline(
+        text,
+        font_name,
+        font_size,
+        max_width_pt,
+        max_height_pt,
+        min_font_size,
+        step,
+    )
+    return list(lines), size
+
+
+@lru_cache(maxsize=2048)
+def _wrap_multiline(
+    text: str,
+    font_name: str,
+    font_size: float,
+    max_width_pt: float,
+    max_height_pt: float,
+    min_font_size: float | None,
+    step: float,
+) -> tuple[tuple[str, ...], float]:
+    """Return the memoized ``(lines, size)`` for ``wrap_text_to_width_multiline``."""
+
     if not text or max_width_pt <= 0 or max_height_pt <= 0:
-        return [], font_size
+        return (), font_size
 
     min_font = min_font_size if min_font_size is not None else font_size
     min_font = max(min_font, 0.5)
 
+    # Widths scale with size, so the widest word and the one-line height are
+    # checked in O(1) per size and only plausible sizes pay for a wrap.
+    words = text.split()
+    widest_advance = max((_advance_total(w, font_name) for w in words), default=0.0)
+
     size = font_size
     while size >= min_font:
         # Before hitting min_font, do not hard-wrap words; shrink instead.
-        words = text.split()
         if words:
-            widest = max(stringWidth(w, font_name, size) for w in words)
+            widest = 0.001 * size * widest_advance
             if widest > max_width_pt and size > min_font:
                 size -= step
                 continue
 
-        wrapped = list(
-            wrap_text_to_width(
-                text=text,
-                font_name=font_name,
-                font_size=size,
-                max_width_pt=max_width_pt,
-            )
+        # Even a single line would be too tall at this size.
+        if size * _LINE_HEIGHT_FACTOR > max_height_pt:
+            size -= step
+            continue
+
+        wrapped = wrap_text_to_width(
+            text=text,
+            font_name=font_name,
+            font_size=size,
+            max_width_pt=max_width_pt,
         )
 
         if wrapped:
-            line_height_est = size * 1.2
+            line_height_est = size * _LINE_HEIGHT_FACTOR
             if len(wrapped) * line_height_est <= max_height_pt:
                 return wrapped, size
         size -= step
 
     # Fallback: allow hard wrap at min font size; if still empty, use original text
-    fallback_lines = list(
-        wrap_text_to_width(
-            text=text,
-            font_name=font_name,
-            font_size=min_font,
-            max_width_pt=max_width_pt,
-        )
-    ) or [text]
+    fallback_lines = wrap_text_to_width(
+        text=text,
+        font_name=font_name,
+        font_size=min_font,
+        max_width_pt=max_width_pt,
+    ) or (text,)
     final_lines = fallback_lines
     final_size = min_font
     return final_lines, final_size
 
 
+@lru_cache(maxsize=2048)
 def wrap_text_to_width(
     text: str,
     font_name: str,
     font_size: float,
     max_width_pt: float,
-) -> Iterable[str]:
-    """Wrap text into lines that fit within the specified width."""
+) -> tuple[str, ...]:
+    """Wrap text into lines that fit within the specified width.
+
+    Results are memoized, so the lines come back as an immutable tuple.
+    """
 
     if not text or max_width_pt <= 0:
-        return []
+        return ()
 
     words = text.split()
     if not words:
-        return []
+        return ()
 
+    space_width = string_width(" ", font_name, font_size)
     lines: list[str] = []
     current: list[str] = []
+    current_width = 0.0
     for word in words:
-        tentative = " ".join(current + [word]) if current else word
-        if stringWidth(tentative, font_name, font_size) <= max_width_pt:
+        word_width = string_width(word, font_name, font_size)
+        tentative = current_width + space_width + word_width if current else word_width
+        if tentative <= max_width_pt:
             current.append(word)
+            current_width = tentative
             continue
 
         if current:
             lines.append(" ".join(current))
             current = [word]
+            current_width = word_width
             continue
 
         # single word exceeds width; perform character-level wrap
         partial = ""
+        partial_width = 0.0
         for ch in word:
-            candidate = partial + ch
-            if stringWidth(candidate, font_name, font_size) > max_width_pt:
+            ch_width = string_width(ch, font_name, font_size)
+            if partial_width + ch_width > max_width_pt:
                 if partial:
                     lines.append(partial)
-                    partial = ch
-                else:
-                    partial = ch
+                partial = ch
+                partial_width = ch_width
             else:
-                partial = candidate
+                partial += ch
+                partial_width += ch_width
         if partial:
             current = [partial]
+            current_width = partial_width
 
     if current:
         lines.append(" ".join(current))
-    return lines
+    return tuple(lines)
 
 
+@lru_cache(maxsize=4096)
 def shrink_fit(
     text: str,
     max_width_pt: float,
@@ -123,16 +218,40 @@ def shrink_fit(
     font_name: str,
     step: float = 0.5,
 ) -> float:
-    """Return the largest font size that fits within ``max_width_pt``."""
+    """Return the largest font size that fits within ``max_width_pt``.
+
+    Candidate sizes step down from ``max_font`` by ``step``. Width is
+    proportional to size, so the first fitting candidate is solved from a
+    single measurement. Results are memoized since the same titles recur
+    across a batch.
+    """
 
-    size = max_font
     step = max(step, 0.25)
-    while (
-        size >= min_font
-        and stringWidth(text, font_name, size) > max_width_pt
-    ):
-        size -= step
-    return max(size, min_font)
+    if max_font < min_font:
+        return min_font
+
+    total = _advance_total(text, font_name)
+
+    def fits(k: int) -> bool:
+        return 0.001 * (max_font - k * step) * total <= max_width_pt
+
+    # Candidates are max_font - k * step for k < count, all >= min_font.
+    count = int((max_font - min_font) // step) + 1
+    # Floor division can miscount by one when step is not a binary fraction.
+    while max_font - count * step >= min_font:
+        count += 1
+    while count > 1 and max_font - (count - 1) * step < min_font:
+        count -= 1
+    k = 0
+    if total > 0:
+        k = math.ceil((max_font - max_width_pt * 1000.0 / total) / step)
+        k = min(max(k, 0), count)
+    # The estimate can be off by one from float rounding at the boundary.
+    while k > 0 and fits(k - 1):
+        k -= 1
+    while k < count and not fits(k):
+        k += 1
+    return max_font - k * step if k < count else min_font
 
 
 def center_baseline(
@@ -158,3 +277,74 @@ def center_baseline(
     ascent_estimate = font_size * 0.7
     baseline = area_top - offset - ascent_estimate
     return max(area_bottom + font_size, min(baseline, area_top))
+
+
+@lru_cache(maxsize=512)
+def qr_image(url: str) -> Image.Image:
+    """Return a cached, border-less QR image of ``url`` at one pixel per module."""
+
+    # Imported on first use so template lookups (e.g. listing options) do not
+    # pay for the QR and MuPDF packages.
+    import qrcode
+
+    qr = qrcode.QRCode(border=0, box_size=1)
+    qr.add_data(url)
+    return qr.make_image().get_image()
+
+
+@contextmanager
+def binary_pdf_streams() -> Iterator[None]:
+    """Write PDF streams without ASCII85 encoding until the block exits."""
+
+    # Label PDFs are only read by MuPDF, so ReportLab's pure-Python ASCII85
+    # pass only costs time and a quarter more bytes per stream. The setting
+    # is global, so it is restored for other ReportLab users afterwards.
+    previous = rl_config.useA85
+    rl_config.useA85 = 0
+    try:
+        yield
+    finally:
+        rl_config.useA85 = previous
+
+
+def rasterize_pdf(
+    pdf_bytes: bytes,
+    dpi: int,
+    rotate: Sequence[bool] = (),
+) -> list[bytes]:
+    """Rasterize every page of ``pdf_bytes`` to grayscale PNG bytes, in page order."""
+
+    return [pix.tobytes("png") for pix in _render_pages(pdf_bytes, dpi, rotate)]
+
+
+def rasterize_pdf_images(
+    pdf_bytes: bytes,
+    dpi: int,
+    rotate: Sequence[bool] = (),
+) -> Iterator[Image.Image]:
+    """Yield each page of ``pdf_bytes`` as a grayscale PIL image, in page order."""
+
+    from PIL import Image
+
+    for pix in _render_pages(pdf_bytes, dpi, rotate):
+        yield Image.frombytes("L", (pix.width, pix.height), pix.samples)
+
+
+def _render_pages(
+    pdf_bytes: bytes,
+    dpi: int,
+    rotate: Sequence[bool],
+) -> Iterator[fitz.Pixmap]:
+    """Yield a grayscale pixmap per page, turning flagged pages counter-clockwise."""
+
+    import fitz
+
+    zoom = dpi / 72.0
+    upright = fitz.Matrix(zoom, zoom)
+    turned = fitz.Matrix(zoom, zoom).prerotate(-90)
+    with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
+        for index, page in enumerate(doc):
+            yield page.get_pixmap(
+                matrix=turned if index < len(rotate) and rotate[index] else upright,
+                colorspace=fitz.csGRAY,
+            )
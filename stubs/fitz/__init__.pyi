@@ -2,8 +2,18 @@ from __future__ import annotations
 
 from typing import Any, Iterator, Optional
 
+csGRAY: Any
+
+
+class Matrix:
+    def __init__(self, a: float, d: float) -> None: ...
+    def prerotate(self, theta: float) -> Matrix: ...
+
 
 class Pixmap:
+    width: int
+    height: int
+    samples: bytes
     def tobytes(self, output: str = ...) -> bytes: ...
 
 
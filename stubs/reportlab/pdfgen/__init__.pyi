@@ -1,3 +1,4 @@
 from __future__ import annotations
 
 from . import canvas as canvas
+from . import textobject as textobject
@@ -1,14 +1,20 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Iterable
+
+from .textobject import PDFTextObject
 
 
 class Canvas:
     def __init__(self, filename_or_buffer: Any, pagesize: tuple[float, float] | None = ...) -> None: ...
+    def setPageSize(self, size: tuple[float, float]) -> None: ...
     def setFont(self, fontName: str, fontSize: float) -> None: ...
     def drawCentredString(self, x: float, y: float, text: str) -> None: ...
     def drawString(self, x: float, y: float, text: str) -> None: ...
+    def beginText(self, x: float = ..., y: float = ...) -> PDFTextObject: ...
+    def drawText(self, aTextObject: PDFTextObject) -> None: ...
     def line(self, x1: float, y1: float, x2: float, y2: float) -> None: ...
+    def lines(self, linelist: Iterable[tuple[float, float, float, float]]) -> None: ...
     def drawImage(
         self,
         image: Any,
@@ -26,6 +32,8 @@ class Canvas:
     def saveState(self) -> None: ...
     def restoreState(self) -> None: ...
     def setLineWidth(self, width: float) -> None: ...
-    def rect(self, x: float, y: float, width: float, height: float) -> None: ...
+    def rect(
+        self, x: float, y: float, width: float, height: float, stroke: int = ..., fill: int = ...
+    ) -> None: ...
     def showPage(self) -> None: ...
     def save(self) -> None: ...
@@ -0,0 +1,8 @@
+from __future__ import annotations
+
+
+class PDFTextObject:
+    def setFont(self, psfontname: str, size: float, leading: float | None = ...) -> None: ...
+    def textLine(self, text: str = ...) -> None: ...
+    def setTextOrigin(self, x: float, y: float) -> None: ...
+    def textOut(self, text: str) -> None: ...
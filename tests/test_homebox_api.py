@@ -3,6 +3,7 @@ import re
 import unittest
 
 from homebox_api import HomeboxApiManager
+from homebox_client.models.repo_tree_item import RepoTreeItem
 from homebox_client.types import UNSET
 
 
@@ -56,5 +57,26 @@ class HomeboxApiHelpersTests(unittest.TestCase):
         self.assertEqual(self.manager._as_int(5), 5)
 
 
+class HomeboxApiPathTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.manager = _make_manager()
+
+    def test_build_location_paths_tracks_parents(self) -> None:
+        tree = [
+            RepoTreeItem(
+                id="root",
+                name="Garage",
+                type_="location",
+                children=[
+                    RepoTreeItem(id="child", name=" Shelf ", type_="location"),
+                    RepoTreeItem(id="item", name="Drill", type_="item"),
+                ],
+            ),
+        ]
+        paths, parents = self.manager._build_location_paths(tree)
+        self.assertEqual(paths, {"root": ["Garage"], "child": ["Garage", "Shelf"]})
+        self.assertEqual(parents, {"root": "", "child": "Garage"})
+
+
 if __name__ == "__main__":
     unittest.main()
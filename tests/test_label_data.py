@@ -58,6 +58,19 @@ class LabelDataTests(unittest.TestCase):
         self.assertEqual(len(contents), 2)
         self.assertEqual(contents[1].url, "http://homebox/location/loc-2")
 
+    def test_locations_to_label_contents_without_id(self) -> None:
+        locs = [
+            Location(
+                id="",
+                display_id="",
+                name="Loose",
+                parent="",
+                asset_count=0,
+            ),
+        ]
+        contents = locations_to_label_contents(locs, "http://homebox/")
+        self.assertEqual(contents[0].url, "http://homebox/locations")
+
     def test_assets_to_label_contents(self) -> None:
         assets = [
             Asset(
@@ -0,0 +1,32 @@
+import unittest
+from io import BytesIO
+
+from PIL import Image
+
+from label_templates import get_template
+from label_templates.label_types import LabelContent
+
+
+def _content(**template_options: str) -> LabelContent:
+    return LabelContent(
+        display_id="BOX.001",
+        name="Box 1",
+        url="http://homebox/location/1",
+        labels=["Tools"],
+        description="Spare parts",
+        template_options=template_options or None,
+    )
+
+
+class LabelTemplateTests(unittest.TestCase):
+    def test_render_label_is_grayscale_png(self) -> None:
+        for name in ("avery5163", "ptouch"):
+            with self.subTest(template=name):
+                png = get_template(name).render_label(_content())
+                image = Image.open(BytesIO(png))
+                self.assertEqual(image.format, "PNG")
+                self.assertEqual(image.mode, "L")
+
+
+if __name__ == "__main__":
+    unittest.main()
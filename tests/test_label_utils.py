@@ -1,9 +1,21 @@
+import math
 import unittest
+from collections.abc import Iterator
+from io import BytesIO
 
+from PIL import Image
+from reportlab import rl_config
 from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.pdfgen import canvas
 
 from label_templates.utils import (
+    binary_pdf_streams,
     center_baseline,
+    fit_prefix,
+    qr_image,
+    rasterize_pdf,
+    rasterize_pdf_images,
+    string_width,
     shrink_fit,
     wrap_text_to_width,
     wrap_text_to_width_multiline,
@@ -26,6 +38,24 @@ class LabelUtilsTests(unittest.TestCase):
         for line in lines:
             self.assertLessEqual(stringWidth(line, "Helvetica", 12), max_width)
 
+    def test_wrap_text_to_width_is_cached(self) -> None:
+        lines = wrap_text_to_width("Hello world", "Helvetica", 12, 30)
+        self.assertIsInstance(lines, tuple)
+        self.assertIs(wrap_text_to_width("Hello world", "Helvetica", 12, 30), lines)
+
+    def test_string_width_matches_reportlab(self) -> None:
+        for text in ("", "Hello world", "BOX.010 | Shelf"):
+            self.assertAlmostEqual(
+                string_width(text, "Helvetica", 12),
+                stringWidth(text, "Helvetica", 12),
+            )
+
+    def test_fit_prefix_trims_to_width(self) -> None:
+        self.assertEqual(fit_prefix("Hello", "Helvetica", 12, 1000), "Hello")
+        self.assertEqual(fit_prefix("Hello", "Helvetica", 12, 0), "")
+        width = stringWidth("Hel", "Helvetica", 12)
+        self.assertEqual(fit_prefix("Hello", "Helvetica", 12, width), "Hel")
+
     def test_wrap_text_to_width_multiline_returns_lines(self) -> None:
         lines, size = wrap_text_to_width_multiline(
             text="Hello world",
@@ -57,6 +87,37 @@ class LabelUtilsTests(unittest.TestCase):
         self.assertGreaterEqual(size, 10)
         self.assertLessEqual(size, 20)
 
+    def test_shrink_fit_matches_linear_walk_at_boundaries(self) -> None:
+        def linear_walk(
+            text: str, max_width: float, max_font: float, min_font: float, step: float
+        ) -> float:
+            # Reference definition: step down from max_font until the text fits.
+            step = max(step, 0.25)
+            k = 0
+            while (
+                max_font - k * step >= min_font
+                and string_width(text, "Helvetica", max_font - k * step) > max_width
+            ):
+                k += 1
+            return max(max_font - k * step, min_font)
+
+        for text in ("BOX.010", "Electrical Supplies", "W"):
+            for max_font, min_font, step in ((20, 10, 0.5), (22, 7.3, 0.3), (18, 9, 0.1)):
+                k = 0
+                while max_font - k * step >= min_font - 1:
+                    exact = string_width(text, "Helvetica", max_font - k * step)
+                    for width in (math.nextafter(exact, 0), exact, math.nextafter(exact, math.inf)):
+                        with self.subTest(text=text, step=step, k=k, width=width):
+                            self.assertEqual(
+                                shrink_fit(text, width, max_font, min_font, "Helvetica", step),
+                                linear_walk(text, width, max_font, min_font, step),
+                            )
+                    k += 1
+
+        self.assertEqual(shrink_fit("BOX.010", 1, 8, 10, "Helvetica"), 10)
+        self.assertEqual(shrink_fit("BOX.010", 1000, 8, 10, "Helvetica"), 10)
+        self.assertEqual(shrink_fit("", 0, 20, 10, "Helvetica", 0.3), 20)
+
     def test_center_baseline_bounds(self) -> None:
         baseline = center_baseline(0, 12, 100, 0, 2)
         self.assertEqual(baseline, 100)
@@ -64,6 +125,51 @@ class LabelUtilsTests(unittest.TestCase):
         self.assertGreaterEqual(baseline, 12)
         self.assertLessEqual(baseline, 100)
 
+    def test_qr_image_is_cached(self) -> None:
+        first = qr_image("http://homebox/location/1")
+        self.assertEqual(first.mode, "1")
+        # One pixel per module: a version 2 code is 25 modules wide.
+        self.assertEqual(first.size, (25, 25))
+        self.assertIs(qr_image("http://homebox/location/1"), first)
+        self.assertIsNot(qr_image("http://homebox/location/2"), first)
+
+    def test_binary_pdf_streams_restores_setting(self) -> None:
+        previous = rl_config.useA85
+        with binary_pdf_streams():
+            self.assertEqual(rl_config.useA85, 0)
+        self.assertEqual(rl_config.useA85, previous)
+
+    def test_rasterize_pdf_renders_each_page(self) -> None:
+        buffer = BytesIO()
+        canvas_obj = canvas.Canvas(buffer)
+        for size in ((72, 36), (36, 72)):
+            canvas_obj.setPageSize(size)
+            canvas_obj.showPage()
+        canvas_obj.save()
+
+        pages = rasterize_pdf(buffer.getvalue(), 72)
+        sizes = [Image.open(BytesIO(png)).size for png in pages]
+        self.assertEqual(sizes, [(72, 36), (36, 72)])
+
+        pages = rasterize_pdf(buffer.getvalue(), 72, rotate=[False, True])
+        sizes = [Image.open(BytesIO(png)).size for png in pages]
+        self.assertEqual(sizes, [(72, 36), (72, 36)])
+
+    def test_rasterize_pdf_images_match_png_pages(self) -> None:
+        buffer = BytesIO()
+        canvas_obj = canvas.Canvas(buffer, pagesize=(72, 36))
+        canvas_obj.rect(10, 10, 20, 10, fill=1)
+        canvas_obj.showPage()
+        canvas_obj.save()
+
+        (png,) = rasterize_pdf(buffer.getvalue(), 144)
+        images = rasterize_pdf_images(buffer.getvalue(), 144)
+        # Pages are rasterized on demand rather than collected up front.
+        self.assertIsInstance(images, Iterator)
+        (image,) = images
+        self.assertEqual(image.mode, "L")
+        self.assertEqual(image.tobytes(), Image.open(BytesIO(png)).tobytes())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -15,12 +15,19 @@ class _FakeApiManager:
 
 
 class WebUiTests(unittest.TestCase):
-    def setUp(self) -> None:
-        self.app: Flask = create_app(
+    app: Flask
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        # The app holds no per-request state, so it is built once; each test
+        # still gets its own client so cookies and sessions do not leak.
+        cls.app = create_app(
             cast(HomeboxApiManager, _FakeApiManager()),
             base_ui="http://homebox",
         )
-        self.app.config["TESTING"] = True
+        cls.app.config["TESTING"] = True
+
+    def setUp(self) -> None:
         self.client: FlaskClient = self.app.test_client()
 
     @patch("homebox_labels_web.collect_locations")
@@ -43,9 +50,8 @@ class WebUiTests(unittest.TestCase):
         ]
         response: Response = self.client.get("/locations")
         self.assertEqual(response.status_code, 200)
-        body = response.get_data(as_text=True)
-        self.assertIn("BOX.001", body)
-        self.assertNotIn("NoId Name", body)
+        self.assertIn(b"BOX.001", response.data)
+        self.assertNotIn(b"NoId Name", response.data)
 
     @patch("homebox_labels_web.collect_locations")
     def test_locations_with_id_disabled(self, mock_collect: Mock) -> None:
@@ -60,8 +66,7 @@ class WebUiTests(unittest.TestCase):
         ]
         response: Response = self.client.get("/locations?with_id=0")
         self.assertEqual(response.status_code, 200)
-        body = response.get_data(as_text=True)
-        self.assertIn("Visible Name", body)
+        self.assertIn(b"Visible Name", response.data)
 
     def test_locations_choose_without_selection_redirects(self) -> None:
         response: Response = self.client.post("/locations/choose", data={})
@@ -82,8 +87,7 @@ class WebUiTests(unittest.TestCase):
         ]
         response: Response = self.client.get("/assets")
         self.assertEqual(response.status_code, 200)
-        body = response.get_data(as_text=True)
-        self.assertIn("Widget", body)
+        self.assertIn(b"Widget", response.data)
 
     def test_assets_choose_without_selection_redirects(self) -> None:
         response: Response = self.client.post("/assets/choose", data={})